@@ -1,8 +1,8 @@
 import json
 import os
+import sqlite3
 import sys
-import time
-from dataclasses import dataclass, asdict, field
+from dataclasses import dataclass, field
 from typing import Dict, Any, Optional, List
 
 from PyQt5 import QtCore, QtGui, QtWidgets, uic
@@ -14,17 +14,84 @@ try:
 except Exception:
     CAMOUFOX_OK = False
 
-PROFILES_FILE = "profiles.json"
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+def _is_fresh(generated: str, *sources: str) -> bool:
+    # A generated module only counts if it is at least as new as its sources;
+    # otherwise running main_window.py directly would show stale assets
+    try:
+        built = os.path.getmtime(os.path.join(HERE, generated))
+        return all(os.path.getmtime(os.path.join(HERE, s)) <= built for s in sources)
+    except OSError:
+        return False
+
+
+# ---- Precompiled UI (generated by run.py via pyuic5) -----------------------
+Ui_MainWindow = object  # fall back to uic.loadUi at runtime
+UI_COMPILED = False
+if _is_fresh("ui_camoufox_manager.py", "camoufox_manager.ui"):
+    try:
+        from ui_camoufox_manager import Ui_MainWindow
+        UI_COMPILED = True
+    except ImportError:
+        pass
+
+# ---- Compiled Qt resources (generated by run.py via pyrcc5) ----------------
+# When it's stale, :/dark.qss is never registered and apply_qss reads the disk copy
+if _is_fresh("resources_rc.py", "resources.qrc", "dark.qss"):
+    try:
+        import resources_rc  # noqa: F401  registers :/dark.qss
+    except ImportError:
+        pass
+
+# ---- Fast JSON (optional) ---------------------------------------------------
+try:
+    import orjson
+    ORJSON_OK = True
+except Exception:
+    ORJSON_OK = False
+
+try:
+    import msgspec
+    MSGSPEC_OK = True
+except Exception:
+    MSGSPEC_OK = False
+
+PROFILES_DB = "profiles.db"
+LOAD_DELAY_MS = 50  # after the first show, before reading profiles
+PROFILES_FILE = "profiles.json"  # legacy store, imported once into PROFILES_DB
 
 
 # ===== Data models =====
-@dataclass
+# Fast path for values JSON already typed correctly; coerce hand-edited ones
+def _as_int(v: Any, default: int) -> int:
+    return v if type(v) is int else int(v or default)
+
+
+def _as_bool(v: Any) -> bool:
+    return v if type(v) is bool else bool(v)
+
+
+# slots=True needs Python 3.10+; older interpreters keep a per-instance __dict__
+_DC_OPTS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DC_OPTS)
 class ProxyConfig:
     host: str = ""
     port: int = 0
     username: str = ""
     password: str = ""
 
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "host": self.host,
+            "port": self.port,
+            "username": self.username,
+            "password": self.password,
+        }
+
     def to_proxy_dict(self) -> Optional[Dict[str, Any]]:
         if not self.host or not self.port:
             return None
@@ -36,7 +103,7 @@ class ProxyConfig:
         return d
 
 
-@dataclass
+@dataclass(**_DC_OPTS)
 class Profile:
     name: str = "Profile"
     viewport_width: int = 1280
@@ -45,89 +112,258 @@ class Profile:
     persistent_dir: str = ""
     use_geoip: bool = False
     proxy: ProxyConfig = field(default_factory=ProxyConfig)
+    db_id: Optional[int] = field(default=None, compare=False, repr=False)  # row in PROFILES_DB; not serialized
 
     def to_dict(self) -> Dict[str, Any]:
-        d = asdict(self)
-        d["proxy"] = asdict(self.proxy)
-        return d
+        # Explicit literal: asdict() deep-copies and reflects on every field
+        return {
+            "name": self.name,
+            "viewport_width": self.viewport_width,
+            "viewport_height": self.viewport_height,
+            "fullscreen": self.fullscreen,
+            "persistent_dir": self.persistent_dir,
+            "use_geoip": self.use_geoip,
+            "proxy": self.proxy.to_dict(),
+        }
 
     @staticmethod
     def from_dict(d: Dict[str, Any]) -> "Profile":
-        raw_proxy = d.get("proxy", {})
-        if not isinstance(raw_proxy, dict):
-            raw_proxy = {}
+        rp = d.get("proxy") or {}
+        if not isinstance(rp, dict):
+            rp = {}
         name = d.get("name", "Profile")
 
         # Default storage to C:\<ProfileName> if empty
-        persistent_dir = d.get("persistent_dir", "")
+        persistent_dir = d.get("persistent_dir")
         if not persistent_dir:
             persistent_dir = os.path.join("C:\\", name)
 
+        # Positional args, in field order, avoid building a kwargs dict
         return Profile(
-            name=name,
-            viewport_width=int(d.get("viewport_width", 1280)),
-            viewport_height=int(d.get("viewport_height", 800)),
-            fullscreen=bool(d.get("fullscreen", False)),
-            persistent_dir=persistent_dir,
-            use_geoip=bool(d.get("use_geoip", False)),
-            proxy=ProxyConfig(
-                host=raw_proxy.get("host", ""),
-                port=int(raw_proxy.get("port", 0) or 0),
-                username=raw_proxy.get("username", ""),
-                password=raw_proxy.get("password", ""),
+            name,
+            _as_int(d.get("viewport_width"), 1280),
+            _as_int(d.get("viewport_height"), 800),
+            _as_bool(d.get("fullscreen", False)),
+            persistent_dir,
+            _as_bool(d.get("use_geoip", False)),
+            ProxyConfig(
+                rp.get("host", ""),
+                _as_int(rp.get("port"), 0),
+                rp.get("username", ""),
+                rp.get("password", ""),
             ),
         )
 
 
+# Typed mirrors of the on-disk schema; msgspec decodes straight into these
+if MSGSPEC_OK:
+    class ProxyStruct(msgspec.Struct):
+        host: str = ""
+        port: int = 0
+        username: str = ""
+        password: str = ""
+
+    class ProfileStruct(msgspec.Struct):
+        name: str = "Profile"
+        viewport_width: int = 1280
+        viewport_height: int = 800
+        fullscreen: bool = False
+        persistent_dir: str = ""
+        use_geoip: bool = False
+        proxy: ProxyStruct = msgspec.field(default_factory=ProxyStruct)
+
+    _PROFILES_DECODER = msgspec.json.Decoder(List[ProfileStruct])  # legacy profiles.json
+    _PROFILE_DECODER = msgspec.json.Decoder(ProfileStruct)  # one profiles.db row
+
+    def _profile_from_struct(s: "ProfileStruct") -> Profile:
+        px = s.proxy
+        return Profile(
+            s.name,
+            s.viewport_width,
+            s.viewport_height,
+            s.fullscreen,
+            s.persistent_dir or os.path.join("C:\\", s.name),
+            s.use_geoip,
+            ProxyConfig(px.host, px.port, px.username, px.password),
+        )
+
+
 # ===== Persistence =====
+def _json_dumps(obj: Any) -> bytes:
+    return orjson.dumps(obj) if ORJSON_OK else json.dumps(obj).encode("utf-8")
+
+
+def _json_loads(data: bytes) -> Any:
+    return orjson.loads(data) if ORJSON_OK else json.loads(data)
+
+
 def load_profiles() -> List[Profile]:
+    # Reads the legacy profiles.json; only used to seed PROFILES_DB
     if not os.path.exists(PROFILES_FILE):
         return []
-    with open(PROFILES_FILE, "r", encoding="utf-8") as f:
-        raw = json.load(f)
-    return [Profile.from_dict(x) for x in raw]
+    with open(PROFILES_FILE, "rb") as f:
+        data = f.read()
+    if MSGSPEC_OK:
+        try:
+            return [_profile_from_struct(s) for s in _PROFILES_DECODER.decode(data)]
+        except msgspec.ValidationError:
+            pass  # e.g. a hand-edited string port; from_dict coerces it
+    return [Profile.from_dict(x) for x in _json_loads(data)]
+
+
+def open_profiles_db(path: str = PROFILES_DB) -> sqlite3.Connection:
+    # One row per profile, so an edit is a single UPDATE instead of a full rewrite
+    db = sqlite3.connect(path)
+    with db:
+        db.execute("CREATE TABLE IF NOT EXISTS profiles (id INTEGER PRIMARY KEY, data BLOB NOT NULL)")
+        # user_version marks the one-time profiles.json import as done, so
+        # deleting every profile later doesn't resurrect the old file
+        if db.execute("PRAGMA user_version").fetchone()[0] == 0:
+            db.executemany("INSERT INTO profiles (data) VALUES (?)",
+                           [(_json_dumps(p.to_dict()),) for p in load_profiles()])
+            db.execute("PRAGMA user_version = 1")
+    return db
+
+
+def _decode_profile_row(data: bytes) -> Profile:
+    if MSGSPEC_OK:
+        try:
+            return _profile_from_struct(_PROFILE_DECODER.decode(data))
+        except msgspec.ValidationError:
+            pass  # mistyped row; from_dict coerces it
+    return Profile.from_dict(_json_loads(data))
+
+
+def load_profiles_db(db: sqlite3.Connection) -> List[Profile]:
+    profiles = []
+    for row_id, data in db.execute("SELECT id, data FROM profiles ORDER BY id"):
+        p = _decode_profile_row(data)
+        p.db_id = row_id
+        profiles.append(p)
+    return profiles
+
+
+def insert_profile(db: sqlite3.Connection, p: Profile) -> None:
+    with db:
+        p.db_id = db.execute("INSERT INTO profiles (data) VALUES (?)",
+                             (_json_dumps(p.to_dict()),)).lastrowid
+
+
+def update_profile(db: sqlite3.Connection, p: Profile) -> None:
+    with db:
+        db.execute("UPDATE profiles SET data = ? WHERE id = ?",
+                   (_json_dumps(p.to_dict()), p.db_id))
+
 
+def delete_profile(db: sqlite3.Connection, p: Profile) -> None:
+    with db:
+        db.execute("DELETE FROM profiles WHERE id = ?", (p.db_id,))
 
-def save_profiles(profiles: List[Profile]) -> None:
-    with open(PROFILES_FILE, "w", encoding="utf-8") as f:
-        json.dump([p.to_dict() for p in profiles], f, indent=2)
 
+# ===== Launch options =====
+# persistent_dir -> absolute path already created this process, so repeat
+# launches skip the makedirs/abspath syscalls
+_PREPARED_DIRS: Dict[str, str] = {}
 
-# ===== Worker thread =====
-class CamoufoxWorker(QtCore.QThread):
+
+def _prepare_storage_dir(path: str) -> str:
+    abs_dir = _PREPARED_DIRS.get(path)
+    if abs_dir is None:
+        abs_dir = os.path.abspath(path)
+        os.makedirs(abs_dir, exist_ok=True)
+        _PREPARED_DIRS[path] = abs_dir
+    return abs_dir
+
+
+def build_launch_options(profile: Profile, launch_size: Optional[tuple[int,int]]=None) -> Dict[str, Any]:
+    W, H = launch_size if launch_size else (profile.viewport_width, profile.viewport_height)
+    opts: Dict[str, Any] = {
+        "headless": False,  # GUI app; sessions are driven by hand
+        # Fullscreen: (W,H) is the screen's available geometry, so open exactly
+        # that size; otherwise add room for the browser chrome around the viewport
+        "window": (W, H) if profile.fullscreen else (W + 2, H + 88),
+    }
+
+    if profile.persistent_dir:
+        opts["persistent_context"] = True
+        opts["user_data_dir"] = _prepare_storage_dir(profile.persistent_dir)
+
+    px = profile.proxy.to_proxy_dict()
+    if px:
+        opts["proxy"] = px
+        if profile.use_geoip:
+            opts["geoip"] = True
+    return opts
+
+
+# ===== Worker (runs on the global QThreadPool) =====
+class CamoufoxSignals(QtCore.QObject):
+    # QRunnable is not a QObject, so its signals live on this helper
     started_ok = QtCore.pyqtSignal(str)
     error = QtCore.pyqtSignal(str)
     stopped = QtCore.pyqtSignal(str)
 
-    def __init__(self, profile: Profile, launch_size: Optional[tuple[int,int]]=None, parent=None):
-        super().__init__(parent)
+
+class CamoufoxRunner(QtCore.QRunnable):
+    def __init__(self, profile: Profile, launch_size: Optional[tuple[int,int]]=None,
+                 opts: Optional[Dict[str, Any]]=None):
+        super().__init__()
+        # MainWindow keeps a reference and queries state after run() returns
+        self.setAutoDelete(False)
+        self.signals = CamoufoxSignals()
+        self.started_ok = self.signals.started_ok
+        self.error = self.signals.error
+        self.stopped = self.signals.stopped
+
         self.profile = profile
         self.launch_size = launch_size  # (W,H) computed from fullscreen or viewport
+        self._opts = opts  # prebuilt on the UI thread; built in run() if omitted
         self._stop = False
+        self._running = False
+        self._stop_mutex = QtCore.QMutex()
+        self._stop_cond = QtCore.QWaitCondition()
+        self._done_cond = QtCore.QWaitCondition()
         self._ctx = None
 
+    # QThread-like API so callers don't care that a pool thread runs us
+    def start(self):
+        self._stop_mutex.lock()
+        self._running = True
+        self._stop_mutex.unlock()
+        QtCore.QThreadPool.globalInstance().start(self)
+
+    def isRunning(self) -> bool:
+        self._stop_mutex.lock()
+        try:
+            return self._running
+        finally:
+            self._stop_mutex.unlock()
+
+    def wait(self, msecs: int) -> bool:
+        self._stop_mutex.lock()
+        try:
+            if self._running:
+                self._done_cond.wait(self._stop_mutex, msecs)
+            return not self._running
+        finally:
+            self._stop_mutex.unlock()
+
     def run(self):
+        try:
+            self._run_session()
+        finally:
+            self._stop_mutex.lock()
+            self._running = False
+            self._done_cond.wakeAll()
+            self._stop_mutex.unlock()
+
+    def _run_session(self):
         if not CAMOUFOX_OK:
             self.error.emit("Camoufox not available. Install with: pip install -U 'camoufox[geoip]' and run 'camoufox fetch'.")
             return
         try:
             W, H = self.launch_size if self.launch_size else (self.profile.viewport_width, self.profile.viewport_height)
-            opts: Dict[str, Any] = {
-                "headless": False,  # GUI app; we use fullscreen instead
-                "window": (W + 2, H + 88),
-            }
-
-            if self.profile.persistent_dir:
-                os.makedirs(self.profile.persistent_dir, exist_ok=True)
-                opts["persistent_context"] = True
-                opts["user_data_dir"] = os.path.abspath(self.profile.persistent_dir)
-
-            px = self.profile.proxy.to_proxy_dict()
-            if px:
-                opts["proxy"] = px
-                if self.profile.use_geoip:
-                    opts["geoip"] = True
-
+            opts = self._opts if self._opts is not None else build_launch_options(self.profile, self.launch_size)
             self._ctx = Camoufox(**opts).__enter__()
 
             # Reuse existing page if present; close extras
@@ -146,7 +382,8 @@ class CamoufoxWorker(QtCore.QThread):
             except Exception:
                 pass
 
-            # Try F11 for true fullscreen if the browser honors it
+            # Camoufox has no start-fullscreen launch option; F11 is the only
+            # way to get true fullscreen, and the browser chrome stays reachable
             if self.profile.fullscreen:
                 try:
                     page.keyboard.press("F11")
@@ -154,8 +391,13 @@ class CamoufoxWorker(QtCore.QThread):
                     pass
 
             self.started_ok.emit(f"Session started for '{self.profile.name}'.")
-            while not self._stop:
-                time.sleep(0.2)
+            # Sleep until request_stop() wakes us; no polling
+            self._stop_mutex.lock()
+            try:
+                while not self._stop:
+                    self._stop_cond.wait(self._stop_mutex)
+            finally:
+                self._stop_mutex.unlock()
 
         except Exception as e:
             self.error.emit(f"Failed to start Camoufox: {e}")
@@ -172,14 +414,22 @@ class CamoufoxWorker(QtCore.QThread):
             self.stopped.emit(f"Session stopped for '{self.profile.name}'.")
 
     def request_stop(self):
-        self._stop = True
+        self._stop_mutex.lock()
+        try:
+            self._stop = True
+            self._stop_cond.wakeAll()
+        finally:
+            self._stop_mutex.unlock()
 
 
 # ===== MainWindow Controller =====
-class MainWindow(QtWidgets.QMainWindow):
+class MainWindow(QtWidgets.QMainWindow, Ui_MainWindow):
     def __init__(self):
         super().__init__()
-        uic.loadUi("camoufox_manager.ui", self)
+        if UI_COMPILED:
+            self.setupUi(self)
+        else:
+            uic.loadUi("camoufox_manager.ui", self)
 
         # Widgets from UI
         self.profileList: QtWidgets.QListWidget
@@ -201,9 +451,11 @@ class MainWindow(QtWidgets.QMainWindow):
         self.stopButton: QtWidgets.QPushButton
 
         # State
-        self.profiles: List[Profile] = load_profiles()
+        self.profiles: List[Profile] = []  # filled by _load_and_populate
         self.current_index: int = -1
-        self.worker: Optional[CamoufoxWorker] = None
+        self._db: Optional[sqlite3.Connection] = None  # opened in _load_and_populate
+        self.worker: Optional[CamoufoxRunner] = None
+        self._load_scheduled: bool = False
 
         # Signals
         self.profileList.itemSelectionChanged.connect(self._on_select_profile)
@@ -214,14 +466,28 @@ class MainWindow(QtWidgets.QMainWindow):
         self.launchButton.clicked.connect(self._launch)
         self.stopButton.clicked.connect(self._stop)
 
+        # Debounce form edits: bursts of keystrokes collapse into one idle pass
+        self._dirty_timer = QtCore.QTimer(self, singleShot=True, interval=150)
+        self._dirty_timer.timeout.connect(self._on_form_idle)
+        for w in [self.nameEdit, self.proxyHostEdit, self.proxyUserEdit,
+                  self.proxyPassEdit, self.storageEdit]:
+            w.textChanged.connect(self._schedule_form_idle)
+        for w in [self.spinW, self.spinH, self.proxyPortSpin]:
+            w.valueChanged.connect(self._schedule_form_idle)
+        for w in [self.fullscreenCheck, self.geoipCheck]:
+            w.toggled.connect(self._schedule_form_idle)
+
         self.launchButton.setObjectName("primary")
         self.stopButton.setObjectName("danger")
 
-        # Initial UI state
-        self._refresh_list()
-        if self.profiles:
-            self.profileList.setCurrentRow(0)
-        self._set_running(False)
+        # Initial UI state; profiles load shortly after the first showEvent (see
+        # showEvent), with everything but the placeholder disabled until then
+        placeholder = QtWidgets.QListWidgetItem("Loading…")
+        placeholder.setFlags(QtCore.Qt.NoItemFlags)
+        self.profileList.addItem(placeholder)
+        self.launchButton.setEnabled(False)
+        self.stopButton.setEnabled(False)
+        self._set_form_enabled(False)
 
         # Professional theme
         QtWidgets.QApplication.setStyle("Fusion")
@@ -245,10 +511,26 @@ class MainWindow(QtWidgets.QMainWindow):
         self.setPalette(p)
 
     # ----- Helpers
+    def _load_and_populate(self):
+        self._db = open_profiles_db()
+        self.profiles = load_profiles_db(self._db)
+        self._refresh_list()
+        self._set_running(False)
+        if self.profiles:
+            self.profileList.setCurrentRow(0)
+
     def _refresh_list(self):
-        self.profileList.clear()
-        for p in self.profiles:
-            self.profileList.addItem(p.name)
+        # One batched insert with repaints and selection signals suspended;
+        # callers re-select a row afterwards, which emits as usual
+        lst = self.profileList
+        lst.setUpdatesEnabled(False)
+        lst.blockSignals(True)
+        try:
+            lst.clear()
+            lst.addItems([p.name for p in self.profiles])
+        finally:
+            lst.blockSignals(False)
+            lst.setUpdatesEnabled(True)
 
     def _current(self) -> Optional[Profile]:
         if 0 <= self.current_index < len(self.profiles):
@@ -256,6 +538,11 @@ class MainWindow(QtWidgets.QMainWindow):
         return None
 
     def _populate_form(self, p: Optional[Profile]):
+        self._fill_form(p)
+        # Programmatic changes aren't user edits; cancel the debounce they started
+        self._dirty_timer.stop()
+
+    def _fill_form(self, p: Optional[Profile]):
         if not p:
             self.nameEdit.setText("")
             self.spinW.setValue(1280); self.spinH.setValue(800)
@@ -294,29 +581,51 @@ class MainWindow(QtWidgets.QMainWindow):
         p.persistent_dir = s
         return p
 
+    def _commit_form(self) -> Profile:
+        # Apply the form to the current profile; write its row only if it changed
+        before = self.profiles[self.current_index].to_dict()
+        p = self._gather_form()
+        self.profiles[self.current_index] = p
+        if p.to_dict() != before:
+            update_profile(self._db, p)
+        return p
+
     def _set_running(self, running: bool):
         # While running: disable Launch, enable Stop, lock editing for safety
         self.launchButton.setEnabled(not running)
         self.stopButton.setEnabled(running)
+        self._set_form_enabled(not running)
+
+    def _set_form_enabled(self, enabled: bool):
         for w in [
             self.profileList, self.newProfileButton, self.deleteProfileButton,
             self.nameEdit, self.spinW, self.spinH, self.fullscreenCheck,
             self.proxyHostEdit, self.proxyPortSpin, self.proxyUserEdit, self.proxyPassEdit,
             self.geoipCheck, self.storageEdit, self.browseStorageButton, self.saveButton
         ]:
-            w.setEnabled(not running)
+            w.setEnabled(enabled)
 
     # ----- Slots
     def _on_select_profile(self):
         self.current_index = self.profileList.currentRow()
         self._populate_form(self._current())
 
+    def _schedule_form_idle(self, *_):
+        # Not wired straight to QTimer.start: valueChanged(int) would select
+        # the start(msec) overload and use the value as the interval
+        self._dirty_timer.start()
+
+    def _on_form_idle(self):
+        # Runs once the form has been quiet for the debounce interval
+        if self.proxyHostEdit.text().strip() and not self.proxyPortSpin.value():
+            self.statusbar.showMessage("Proxy port is required when a proxy host is set", 3000)
+
     def _new_profile(self):
         p = Profile(name=f"Profile {len(self.profiles)+1}")
         # default storage C:\<name>
         p.persistent_dir = os.path.join("C:\\", p.name)
+        insert_profile(self._db, p)
         self.profiles.append(p)
-        save_profiles(self.profiles)
         self._refresh_list()
         self.profileList.setCurrentRow(len(self.profiles)-1)
         self.statusbar.showMessage("New profile created", 3000)
@@ -328,8 +637,8 @@ class MainWindow(QtWidgets.QMainWindow):
         name = self.profiles[row].name
         if QtWidgets.QMessageBox.question(self, "Confirm Delete", f"Delete profile '{name}'?") != QtWidgets.QMessageBox.Yes:
             return
+        delete_profile(self._db, self.profiles[row])
         del self.profiles[row]
-        save_profiles(self.profiles)
         self._refresh_list()
         self._populate_form(None)
         self.current_index = -1
@@ -339,10 +648,10 @@ class MainWindow(QtWidgets.QMainWindow):
         if self.current_index == -1:
             self._new_profile()
             return
-        self.profiles[self.current_index] = self._gather_form()
-        save_profiles(self.profiles)
-        self._refresh_list()
-        self.profileList.setCurrentRow(self.current_index)
+        p = self._commit_form()
+        # Only this row can have changed; selection is preserved
+        self.profileList.item(self.current_index).setText(p.name)
+        self._populate_form(p)  # reflect defaults filled in by _gather_form
         self.statusbar.showMessage("Profile saved", 3000)
 
     def _browse_storage(self):
@@ -358,10 +667,8 @@ class MainWindow(QtWidgets.QMainWindow):
             QtWidgets.QMessageBox.information(self, "No profile", "Create or select a profile first.")
             return
 
-        prof = self._gather_form()
         # persist edits before launch
-        self.profiles[self.current_index] = prof
-        save_profiles(self.profiles)
+        prof = self._commit_form()
 
         if not CAMOUFOX_OK:
             QtWidgets.QMessageBox.warning(self, "Camoufox not available",
@@ -375,7 +682,15 @@ class MainWindow(QtWidgets.QMainWindow):
         else:
             launch_size = (prof.viewport_width, prof.viewport_height)
 
-        self.worker = CamoufoxWorker(prof, launch_size)
+        # Do the filesystem/proxy housekeeping here so the worker can start
+        # bringing up the browser immediately
+        try:
+            opts = build_launch_options(prof, launch_size)
+        except OSError as e:
+            QtWidgets.QMessageBox.critical(self, "Session Error", f"Cannot prepare storage directory: {e}")
+            return
+
+        self.worker = CamoufoxRunner(prof, launch_size, opts=opts)
         self.worker.started_ok.connect(lambda m: self.statusbar.showMessage(m, 5000))
         self.worker.error.connect(lambda m: QtWidgets.QMessageBox.critical(self, "Session Error", m))
         self.worker.stopped.connect(self._on_stopped)
@@ -394,7 +709,40 @@ class MainWindow(QtWidgets.QMainWindow):
         self.statusbar.showMessage(msg, 5000)
         self._set_running(False)
 
+    def showEvent(self, event: QtGui.QShowEvent):
+        super().showEvent(event)
+        if not self._load_scheduled:
+            # A short delay rather than 0 so the window is exposed and painted
+            # before profiles.db is opened and read
+            self._load_scheduled = True
+            QtCore.QTimer.singleShot(LOAD_DELAY_MS, self._load_and_populate)
+
+    def closeEvent(self, event: QtGui.QCloseEvent):
+        # The runner blocks until asked to stop, and QApplication waits for the
+        # global pool on exit; stop it here so shutdown can't hang
+        if self.worker and self.worker.isRunning():
+            self.worker.request_stop()
+            if not self.worker.wait(5000):
+                # Still inside Camoufox; quitting now would block on the pool
+                self.statusbar.showMessage("Stopping session…", 3000)
+                QtWidgets.QMessageBox.warning(self, "Session still stopping",
+                                              "The browser session is still shutting down. Try closing again in a moment.")
+                event.ignore()
+                return
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+        super().closeEvent(event)
+
 def apply_qss(app, path="dark.qss"):
+    # Prefer the copy compiled into resources_rc; fall back to disk
+    res = QtCore.QFile(":/" + path)
+    if res.open(QtCore.QIODevice.ReadOnly):
+        try:
+            app.setStyleSheet(bytes(res.readAll()).decode("utf-8"))
+        finally:
+            res.close()
+        return
     full = os.path.abspath(path)
     if not os.path.exists(full):
         raise FileNotFoundError(f"QSS not found: {full}")
@@ -1,13 +1,15 @@
 import os
 import sys
 import subprocess
-import importlib.util
+import importlib.metadata
 from pathlib import Path
+from typing import Optional
 from shutil import which
 
-REQUIREMENTS = ["PyQt5", "camoufox[geoip]"]
+REQUIREMENTS = ["PyQt5", "camoufox[geoip]", "orjson", "msgspec"]
 
 HERE = Path(__file__).resolve().parent       # directory containing install.py
+CACHE_FILE = Path.home() / ".camoufox_manager" / "cache.json"
 # Candidate entry files for your app (first one found is used)
 ENTRY_CANDIDATES = [
     "main_window.py",
@@ -20,6 +22,10 @@ def run(cmd, cwd=None):
 def pip_install(pkg):
     run([sys.executable, "-m", "pip", "install", pkg], cwd=HERE)
 
+def norm_name(name: str) -> str:
+    # PEP 503 normalisation so "PyQt5"/"pyqt5" and "-"/"_" compare equal
+    return name.lower().replace("_", "-").replace(".", "-")
+
 def check_and_install():
     try:
         import pip  # noqa
@@ -27,14 +33,54 @@ def check_and_install():
         print("[x] pip is not installed. Please install pip and re-run.")
         sys.exit(1)
 
+    # One pass over installed distributions instead of a finder walk per package
+    installed = {
+        norm_name(d.metadata["Name"])
+        for d in importlib.metadata.distributions()
+        if d.metadata["Name"]
+    }
     for spec in REQUIREMENTS:
         base = spec.split("[", 1)[0]
-        if importlib.util.find_spec(base) is None:
+        if norm_name(base) not in installed:
             print(f"[!] Missing {spec}, installing…")
             pip_install(spec)
         else:
             print(f"[✓] {base} already installed")
 
+def json_loads(data: bytes):
+    try:
+        import orjson
+        return orjson.loads(data)
+    except ImportError:
+        import json
+        return json.loads(data)
+
+def json_dumps(obj) -> bytes:
+    try:
+        import orjson
+        return orjson.dumps(obj)
+    except ImportError:
+        import json
+        return json.dumps(obj).encode("utf-8")
+
+def read_cached_exe() -> Optional[Path]:
+    # Valid only while the binary is still there and unchanged since we saw it
+    try:
+        cached = json_loads(CACHE_FILE.read_bytes())
+        exe = Path(cached["exe"])
+        if exe.stat().st_mtime == cached["mtime"]:
+            return exe
+    except Exception:
+        pass
+    return None
+
+def write_cached_exe(exe_path: Path):
+    try:
+        CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        CACHE_FILE.write_bytes(json_dumps({"exe": str(exe_path), "mtime": exe_path.stat().st_mtime}))
+    except OSError as e:
+        print(f"[!] Could not write {CACHE_FILE}: {e}")
+
 def ensure_camoufox_browser():
     try:
         from camoufox.sync_api import Camoufox  # noqa
@@ -43,6 +89,11 @@ def ensure_camoufox_browser():
         print("[!] Installing camoufox…")
         pip_install("camoufox[geoip]")
 
+    cached = read_cached_exe()
+    if cached:
+        print(f"[✓] Camoufox binary present at {cached} (cached)")
+        return
+
     # Try to locate the browser binary
     try:
         out = subprocess.check_output(
@@ -55,13 +106,25 @@ def ensure_camoufox_browser():
     def looks_like_browser_dir(p: Path) -> bool:
         return p.exists() and p.is_dir()
 
-    def find_exe_in(dir_path: Path) -> Path | None:
+    def find_exe_in(dir_path: Path, max_depth: int = 3) -> Optional[Path]:
+        # The binary sits a level or two down; walk only that deep and stop
+        # at the first hit instead of stat-ing the whole install tree
         exe_name = "camoufox.exe" if os.name == "nt" else "camoufox"
-        for path in dir_path.rglob(exe_name):
-            return path
+        stack = [(str(dir_path), 0)]
+        while stack:
+            d, depth = stack.pop()
+            try:
+                with os.scandir(d) as it:
+                    for e in it:
+                        if e.name == exe_name and e.is_file():
+                            return Path(e.path)
+                        if depth < max_depth and e.is_dir(follow_symlinks=False):
+                            stack.append((e.path, depth + 1))
+            except OSError:
+                continue
         return None
 
-    exe_path: Path | None = None
+    exe_path: Optional[Path] = None
     if out:
         p = Path(out)
         if p.is_file():
@@ -71,11 +134,32 @@ def ensure_camoufox_browser():
 
     if exe_path and exe_path.exists():
         print(f"[✓] Camoufox binary present at {exe_path}")
+        write_cached_exe(exe_path)
         return
 
     print("[!] Camoufox browser binary not found. Fetching…")
     run([sys.executable, "-m", "camoufox", "fetch"], cwd=HERE)
 
+def compile_if_stale(tool, src_name, out_name, deps=(), fallback=None):
+    src = HERE / src_name
+    out = HERE / out_name
+    newest = max((HERE / n).stat().st_mtime for n in (src_name, *deps))
+    if out.exists() and out.stat().st_mtime >= newest:
+        print(f"[✓] {out.name} up to date")
+        return
+    print(f"[!] Compiling {src.name} → {out.name}…")
+    try:
+        run([sys.executable, "-m", tool, "-o", out.name, src.name], cwd=HERE)
+    except subprocess.CalledProcessError:
+        print(f"[!] {tool} failed; the app will read {fallback or src.name} from disk instead")
+
+def compile_ui():
+    # Pre-compile the Qt Designer file so the app skips XML parsing at startup
+    compile_if_stale("PyQt5.uic.pyuic", "camoufox_manager.ui", "ui_camoufox_manager.py")
+    # Embed the stylesheet as a Qt resource so it loads from memory
+    compile_if_stale("PyQt5.pyrcc_main", "resources.qrc", "resources_rc.py",
+                     deps=("dark.qss",), fallback="dark.qss")
+
 def find_entry_file() -> Path:
     for name in ENTRY_CANDIDATES:
         candidate = HERE / name
@@ -89,6 +173,7 @@ def find_entry_file() -> Path:
 def main():
     check_and_install()
     ensure_camoufox_browser()
+    compile_ui()
 
     entry = find_entry_file()
     print("\n[✓] Environment ready. Launching Camoufox Manager…\n")